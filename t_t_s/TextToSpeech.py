@@ -1,12 +1,32 @@
+import argparse
+import atexit
+import base64
+import hashlib
+import mmap
 import os
 import re
+import shutil
+import sys
+import threading
 import time
+import urllib.request
+import xml.etree.ElementTree as ET
+import zipfile
 from io import BytesIO
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import gtts
-from playsound import playsound
+import requests
+from requests.adapters import HTTPAdapter
+
+# Optional fallback player; pygame below is the primary audio backend, and
+# batch runs may have no player at all.
+try:
+    from playsound import playsound
+    PLAYSOUND_AVAILABLE = True
+except Exception:
+    PLAYSOUND_AVAILABLE = False
 
 # Optional import for .docx support
 try:
@@ -15,42 +35,352 @@ try:
 except Exception:
     DOCX_AVAILABLE = False
 
+# Optional in-memory audio playback. One mixer is initialised for the whole
+# process, so prompts play straight from bytes without writing temp files or
+# spawning a player subprocess per call (which is what playsound does).
+# Falls back to playsound if pygame or the audio device is unavailable.
+try:
+    import pygame
+    pygame.mixer.init(frequency=24000)
+    atexit.register(pygame.mixer.quit)
+    # The mixer posts this event from its callback thread when a track
+    # ends, letting playback waits sleep on the event queue instead of
+    # polling. Needs the SDL event/video subsystem; if that fails (pure
+    # headless), the wait loops below fall back to polling.
+    _AUDIO_END_EVENT = pygame.USEREVENT + 1
+    pygame.mixer.music.set_endevent(_AUDIO_END_EVENT)
+    try:
+        pygame.display.init()
+    except Exception:
+        pass
+    PYGAME_AVAILABLE = True
+except Exception:
+    PYGAME_AVAILABLE = False
+
+
+# =========================
+# Shared HTTP session
+# =========================
+# Stock gTTS opens a brand-new TLS connection per request (it creates a
+# requests.Session inside stream() and closes it right away), so every
+# paragraph pays the full TCP + TLS handshake again. Keep one keep-alive
+# session for the whole process instead; pool size covers the worst-case
+# concurrency: up to 32 paragraph workers (see _pick_max_workers) plus the
+# shared sentence-chunk pool. Retries stay at 0 here because
+# tts_bytes_with_retry already does its own backoff.
+_POOL_SIZE = 48
+
+# Requests go out with verify=False, matching stock gTTS (proxy and
+# firewall tolerance); silence urllib3's per-request InsecureRequestWarning
+# once here, the same way stock gTTS.stream() does before each send.
+try:
+    requests.packages.urllib3.disable_warnings(
+        requests.packages.urllib3.exceptions.InsecureRequestWarning
+    )
+except Exception:
+    pass
+
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=_POOL_SIZE,
+    pool_maxsize=_POOL_SIZE,
+    max_retries=0,
+))
+
+# The base64 audio payload embedded in a translate.google response line
+_AUDIO_PAYLOAD_RE = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
+
+class PooledTTS(gtts.gTTS):
+    """
+    gTTS subclass that sends its prepared requests through the shared
+    keep-alive session above instead of a throwaway per-call session.
+    Falls back to the stock implementation if gtts internals change.
+    """
+
+    def stream(self):
+        prepare = getattr(self, "_prepare_requests", None)
+        if prepare is None:
+            # gtts internals changed; use the stock (slower) path
+            yield from super().stream()
+            return
+
+        for pr in prepare():
+            try:
+                r = _session.send(
+                    request=pr,
+                    verify=False,
+                    proxies=urllib.request.getproxies(),
+                    timeout=getattr(self, "timeout", None),
+                )
+                r.raise_for_status()
+            except requests.exceptions.HTTPError:
+                raise gtts.gTTSError(tts=self, response=r)
+            except requests.exceptions.RequestException:
+                raise gtts.gTTSError(tts=self)
+
+            yield from self._extract_audio(r)
+
+    @staticmethod
+    def _extract_audio(response):
+        """Decode the audio payload lines of a translate.google response."""
+        for line in response.iter_lines(chunk_size=1024):
+            decoded_line = line.decode("utf-8")
+            if "jQ1olc" in decoded_line:
+                audio_search = _AUDIO_PAYLOAD_RE.search(decoded_line)
+                if not audio_search:
+                    raise gtts.gTTSError(response=response)
+                yield base64.b64decode(audio_search.group(1).encode("ascii"))
+
+
+def _fast_tts(text: str) -> bytes:
+    """
+    Fetch MP3 bytes for a short text with one direct translate_tts GET
+    over the shared session. gTTS's tokenizer and chunker are pure
+    overhead for texts under its 100-character chunk limit — every spoken
+    prompt in this app. Raises on a bad response; callers fall back to
+    the full gTTS path.
+    """
+    r = _session.get(
+        "https://translate.google.com/translate_tts",
+        params={"ie": "UTF-8", "q": text, "tl": "en", "client": "tw-ob"},
+        timeout=10,
+    )
+    r.raise_for_status()
+    return r.content
+
+
+# =========================
+# Synthesis cache
+# =========================
+# The CLI speaks the same fixed prompts on every run; re-synthesizing them
+# over the network each time is wasted round-trips. Keep finished MP3s in a
+# persistent directory keyed by SHA-256 of the text, so anything already
+# spoken once plays instantly on later runs. Paragraph synthesis reuses the
+# same cache.
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cli_tts")
+_CACHE_LIMIT_MB = 50
+
+
+def _cache_path(text: str) -> str:
+    return os.path.join(_CACHE_DIR, hashlib.sha256(text.encode("utf-8")).hexdigest() + ".mp3")
+
+
+def _write_file_bytes(path: str, data: bytes):
+    """
+    Write a whole file with raw os-level calls: exactly one open, one
+    (unbuffered) write per chunk the kernel accepts, one close. Skips the
+    Python buffered-file layer, which is pure overhead for a single
+    write-everything-at-once blob.
+
+    Goes through a temp name + os.replace, so the target gets a fresh
+    inode: truncating in place would write through any hardlinked
+    duplicate MP3s left by an earlier run, and a crash mid-write can
+    never leave a truncated file behind. The temp name is unique per
+    writer — with a shared name, two threads storing the same cache entry
+    would race and the loser's os.replace would blow up on the temp file
+    the winner already renamed away.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _cache_store(text: str, data: bytes) -> str:
+    """
+    Write MP3 bytes into the cache and return the cache path.
+    _write_file_bytes replaces atomically, so a crash mid-write never
+    leaves a truncated cache entry behind.
+    """
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    path = _cache_path(text)
+    _write_file_bytes(path, data)
+    _evict_lru()
+    return path
+
+
+def _evict_lru():
+    """
+    Trim the cache back under _CACHE_LIMIT_MB, least-recently-played first.
+    Best effort: cache trouble should never break the app.
+    """
+    try:
+        entries = []
+        for e in os.scandir(_CACHE_DIR):
+            if e.name.endswith(".mp3"):
+                st = e.stat()
+                entries.append((st.st_atime, st.st_size, e.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    limit = _CACHE_LIMIT_MB * 1024 * 1024
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def _cached_tts_bytes(text: str) -> bytes:
+    """
+    Return MP3 bytes for `text`, synthesizing and caching them on a miss.
+    """
+    path = _cache_path(text)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read()
+    data = None
+    if len(text) < 100:
+        try:
+            data = _fast_tts(text)
+        except Exception:
+            data = None  # endpoint hiccup; take the full gTTS path
+    if data is None:
+        buf = BytesIO()
+        PooledTTS(text).write_to_fp(buf)
+        data = buf.getvalue()
+    _cache_store(text, data)
+    return data
+
 
 # =========================
 # Voice prompt helper
 # =========================
-def speak_and_delete(text_to_speak: str):
+# Spoken prompts only make sense with a human at a terminal. Scripted runs
+# (piped stdin, --quiet, batch mode) flip this off and skip the ~20 prompt
+# synthesis/playback round-trips entirely. Set by main().
+INTERACTIVE = True
+def _wait_audio(busy):
+    """
+    Block until busy() reports false. Sleeps on the mixer's end event when
+    the SDL event system is up (zero wakeups during playback); otherwise
+    falls back to a coarse poll.
+    """
+    try:
+        while busy():
+            pygame.event.wait(200)  # woken early by _AUDIO_END_EVENT
+    except pygame.error:
+        while busy():
+            pygame.time.wait(10)
+
+
+def _play_bytes(data: bytes):
+    """
+    Play MP3 bytes straight from memory through the shared pygame mixer.
+    Blocking, like the playsound path it replaces.
+    """
+    channel = pygame.mixer.Sound(BytesIO(data)).play()
+    if channel is not None:
+        channel.set_endevent(_AUDIO_END_EVENT)
+        _wait_audio(channel.get_busy)
+
+
+def notify(message: str):
+    """
+    Show and speak the same message — the common "print it and say it"
+    pair collapsed into one call.
+    """
+    print(message)
+    speak(message)
+
+
+def _play_file(path: str):
+    """
+    Play an MP3 file through the persistent mixer. The audio device is
+    opened once at import, so per-file playback pays no player startup
+    cost. Falls back to playsound (one subprocess per call) without pygame.
+    """
+    if not PYGAME_AVAILABLE:
+        if not PLAYSOUND_AVAILABLE:
+            raise RuntimeError("No audio backend available (pygame or playsound required)")
+        playsound(path)
+        return
+    pygame.mixer.music.load(path)
+    pygame.mixer.music.play()
+    _wait_audio(pygame.mixer.music.get_busy)
+    pygame.mixer.music.unload()
+
+
+def speak(text_to_speak: str):
     """
-    Converts text to speech, plays it, and deletes the temporary file.
+    Converts text to speech and plays it. Synthesized prompts are kept in
+    the on-disk cache, so repeated prompts cost no network round-trip, and
+    playback goes straight from memory — no temp files to guard or delete.
     Keep this simple and blocking to avoid race conditions.
+    No-op in non-interactive runs.
     """
+    if not INTERACTIVE:
+        return
     try:
-        temp_file = "temp_audio.mp3"
-        tts = gtts.gTTS(text_to_speak)
-        tts.save(temp_file)
-        # small guard in case FS is slow
-        time.sleep(0.05)
-        playsound(temp_file)
-        # guard to avoid racing the OS
-        time.sleep(0.05)
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+        data = _cached_tts_bytes(text_to_speak)
+        if PYGAME_AVAILABLE:
+            _play_bytes(data)
+        else:
+            # _cached_tts_bytes just ensured the cache file exists
+            _play_file(_cache_path(text_to_speak))
     except Exception as e:
         print(f"[speak] An error occurred: {e}")
         print("Could not play the audio. Please check your internet connection.")
 
 
+# =========================
+# Speculative prompt prefetch
+# =========================
+# While the program is blocked in input(), the next prompt it will speak is
+# usually already known — it is a string constant a few lines further down
+# the flow. A single background worker warms the synthesis cache for those
+# prompts, so by the time the user answers, the next prompt plays without
+# waiting on the network.
+_prefetch_pool = ThreadPoolExecutor(max_workers=1)
+
+
+def _prefetch_one(text: str):
+    try:
+        _cached_tts_bytes(text)
+    except Exception:
+        pass  # purely speculative; speak() will retry and report for real
+
+
+def _prefetch_prompts(*texts: str):
+    """
+    Warm the synthesis cache for prompts we expect to speak soon.
+    Safe to call with prompts that may never be spoken.
+    """
+    if not INTERACTIVE:
+        return
+    for text in texts:
+        if not os.path.exists(_cache_path(text)):
+            _prefetch_pool.submit(_prefetch_one, text)
+
+
 # =========================
 # Text handling
 # =========================
+_PARA_RE = re.compile(r'\n{2,}')
+
+
 def split_into_paragraphs(text: str) -> List[str]:
     """
     Split text into paragraphs using blank lines as separators.
     Handles multiple blank lines and trims whitespace.
     """
-    parts = re.split(r'(?:\r?\n){2,}', text.strip())
-    paragraphs = [p.strip() for p in parts if p.strip()]
-    return paragraphs
+    # str.replace runs in C at memchr speed; normalizing CRLF up front
+    # keeps the separator pattern free of the \r? alternation, which
+    # matters for multi-megabyte inputs.
+    norm = text.replace('\r\n', '\n')
+    # Strip each part once, not once to test and again to yield
+    stripped = (p.strip() for p in _PARA_RE.split(norm.strip()))
+    return [s for s in stripped if s]
 
 
 def choose_input_mode() -> str:
@@ -59,7 +389,12 @@ def choose_input_mode() -> str:
     Returns 't' or 'f'.
     """
     while True:
-        speak_and_delete("Would you like to enter text directly, or use a text file? Enter t for text or f for file.")
+        speak("Would you like to enter text directly, or use a text file? Enter t for text or f for file.")
+        # whichever the user picks, one of these two is spoken next
+        _prefetch_prompts(
+            "Paste or type your text. Use a blank line between sections to create separate audio files.",
+            "Please enter the full path of the text file. It can be a dot t x t or dot doc x file.",
+        )
         mode = input("Enter text directly or use a text file? (t/f): ").strip().lower()
         if mode in ('t', 'f'):
             return mode
@@ -70,7 +405,7 @@ def read_text_from_stdin() -> str:
     """
     Read multi-line text from stdin until EOF.
     """
-    speak_and_delete("Paste or type your text. Use a blank line between sections to create separate audio files.")
+    speak("Paste or type your text. Use a blank line between sections to create separate audio files.")
     print("Enter your text. Use blank lines to separate paragraphs.")
     print("Finish with Ctrl+D (Linux/Mac) or Ctrl+Z then Enter (Windows):")
     print("(Start typing below)")
@@ -84,6 +419,25 @@ def read_text_from_stdin() -> str:
     return "\n".join(lines).strip()
 
 
+_DOCX_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _read_docx_fast(path: str) -> str:
+    """
+    Extract paragraph text from a .docx by streaming word/document.xml
+    directly out of the zip container. python-docx builds the whole XML
+    tree plus a Python object per paragraph; this keeps memory constant
+    regardless of document size and needs no third-party package.
+    """
+    paras = []
+    with zipfile.ZipFile(path) as z, z.open("word/document.xml") as f:
+        for _, elem in ET.iterparse(f, events=("end",)):
+            if elem.tag == _DOCX_NS + "p":
+                paras.append("".join(t.text or "" for t in elem.iter(_DOCX_NS + "t")))
+                elem.clear()  # free the subtree we just consumed
+    return "\n".join(paras).strip()
+
+
 def read_text_from_file(path: str) -> str:
     """
     Read text from a .txt or .docx file.
@@ -97,16 +451,25 @@ def read_text_from_file(path: str) -> str:
 
     ext = os.path.splitext(path)[1].lower()
     if ext == ".txt":
+        # Map the file once; if UTF-8 decoding fails, the same mapped
+        # bytes are re-decoded as cp1252 instead of re-reading the file.
+        with open(path, "rb") as f:
+            if os.path.getsize(path) == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                raw = mm[:]
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read().strip()
+            return raw.decode("utf-8").strip()
         except UnicodeDecodeError:
-            with open(path, "r", encoding="cp1252", errors="replace") as f:
-                return f.read().strip()
+            return raw.decode("cp1252", errors="replace").strip()
 
     elif ext == ".docx":
-        if not DOCX_AVAILABLE:
-            raise RuntimeError("Reading .docx requires 'python-docx'. Install with: pip install python-docx")
+        try:
+            return _read_docx_fast(path)
+        except Exception:
+            # Unusual container layout; let python-docx have a try
+            if not DOCX_AVAILABLE:
+                raise
         doc = Document(path)
         # Preserve paragraph boundaries; Word paragraphs map naturally here
         return "\n".join(p.text for p in doc.paragraphs).strip()
@@ -124,18 +487,17 @@ def get_text_via_choice() -> str:
         return read_text_from_stdin()
     else:
         while True:
-            speak_and_delete("Please enter the full path of the text file. It can be a dot t x t or dot doc x file.")
+            speak("Please enter the full path of the text file. It can be a dot t x t or dot doc x file.")
             path = input("Enter path to .txt or .docx file: ").strip()
             try:
                 text = read_text_from_file(path)
                 if not text:
-                    print("The file appears to be empty. Please choose another file.")
-                    speak_and_delete("The file appears to be empty. Please choose another file.")
+                    notify("The file appears to be empty. Please choose another file.")
                     continue
                 return text
             except Exception as e:
                 print(f"Could not read the file: {e}")
-                speak_and_delete("Could not read the file. Please try again.")
+                speak("Could not read the file. Please try again.")
 
 
 # =========================
@@ -150,41 +512,52 @@ def get_folder_and_confirm_overwrite(num_files_expected: int) -> str:
     Returns absolute folder path.
     """
     while True:
+        # the playback question always follows folder selection in main()
+        _prefetch_prompts("Do you want me to play the audio files now? Please enter y for yes or n for no.")
         folder_name = input("Enter the folder name: ").strip()
         if not folder_name:
-            speak_and_delete("Folder name cannot be empty. Please try again.")
-            print("Folder name cannot be empty. Please try again.")
+            notify("Folder name cannot be empty. Please try again.")
+            continue
+
+        # Cheap writability pre-check: a mistyped or read-only location is
+        # caught here without paying makedirs' exception path on each retry
+        parent = os.path.dirname(os.path.abspath(folder_name)) or "."
+        if os.path.isdir(parent) and not os.access(parent, os.W_OK):
+            print(f"No write permission for '{parent}'.")
+            speak("I cannot write to that location. Please try a different name.")
             continue
 
         try:
             os.makedirs(folder_name, exist_ok=True)
         except Exception as e:
             print(f"Could not create or access the folder '{folder_name}': {e}")
-            speak_and_delete("Could not create or access the folder. Please try a different name.")
+            speak("Could not create or access the folder. Please try a different name.")
             continue
 
         folder_abs = os.path.abspath(folder_name)
-        targets = [os.path.join(folder_abs, f"{i}.mp3") for i in range(1, num_files_expected + 1)]
-        conflicts = [p for p in targets if os.path.exists(p)]
+        # One directory scan instead of a stat syscall per expected file
+        existing = {entry.name for entry in os.scandir(folder_abs)}
+        conflicts = [os.path.join(folder_abs, f"{i}.mp3")
+                     for i in range(1, num_files_expected + 1)
+                     if f"{i}.mp3" in existing]
 
         if conflicts:
             while True:
-                speak_and_delete(f"{len(conflicts)} files already exist in the folder. "
+                speak(f"{len(conflicts)} files already exist in the folder. "
                                  f"Do you want to overwrite them? Enter y for yes or n for no.")
                 choice = input(f"{len(conflicts)} target files already exist. Overwrite all? (y/n): ").strip().lower()
                 if choice == 'y':
-                    for p in conflicts:
-                        try:
-                            os.remove(p)
-                        except Exception as e:
-                            print(f"Warning: Could not remove existing file '{p}': {e}")
+                    # No pre-delete needed: generation writes each target
+                    # via temp name + os.replace, which swaps in a fresh
+                    # inode — safe even over hardlinked duplicates from a
+                    # previous run — and the duplicate hardlink step
+                    # unlinks its own target.
                     return folder_abs
                 elif choice == 'n':
-                    speak_and_delete("Please enter a different folder name.")
-                    print("Please enter a different folder name.")
+                    notify("Please enter a different folder name.")
                     break
                 else:
-                    speak_and_delete("Invalid input. Please enter y for yes or n for no.")
+                    speak("Invalid input. Please enter y for yes or n for no.")
                     print("Invalid input. Please enter 'y' or 'n'.")
         else:
             return folder_abs
@@ -196,7 +569,8 @@ def ask_playback() -> bool:
     Returns True for yes, False for no. Re-prompts on invalid input.
     """
     while True:
-        speak_and_delete("Do you want me to play the audio files now? Please enter y for yes or n for no.")
+        speak("Do you want me to play the audio files now? Please enter y for yes or n for no.")
+        _prefetch_prompts("I will start playing each paragraph as soon as it is ready.")
         ans = input("Play the audio files now? (y/n): ").strip().lower()
         if ans in ('y', 'n'):
             return ans == 'y'
@@ -206,19 +580,27 @@ def ask_playback() -> bool:
 # =========================
 # Parallel TTS generation
 # =========================
+# One reusable synthesis buffer per worker thread; rewinding and
+# truncating is cheaper than allocating a fresh BytesIO per attempt.
+_tls = threading.local()
+
+
 def tts_bytes_with_retry(text: str, retries: int = 3, base_delay: float = 0.4) -> bytes:
     """
     Convert text to MP3 bytes using gTTS with simple retry and exponential backoff.
     Raises the last exception if all attempts fail.
     """
+    buf = getattr(_tls, "buf", None)
+    if buf is None:
+        buf = _tls.buf = BytesIO()
     last_err = None
     for attempt in range(1, retries + 1):
         try:
-            buf = BytesIO()
-            tts = gtts.gTTS(text)
-            tts.write_to_fp(buf)
             buf.seek(0)
-            return buf.read()
+            buf.truncate(0)
+            PooledTTS(text).write_to_fp(buf)
+            # getvalue() copies out, so the buffer can be reused next call
+            return buf.getvalue()
         except Exception as e:
             last_err = e
             # backoff: 0.4, 0.8, 1.6, ...
@@ -226,6 +608,116 @@ def tts_bytes_with_retry(text: str, retries: int = 3, base_delay: float = 0.4) -
     raise last_err
 
 
+# One paragraph used to be one serialized gTTS call, so a single huge
+# paragraph dominated wall-clock even with a full worker pool. Long
+# paragraphs are split on sentence boundaries into ~200-char chunks that
+# synthesize concurrently; gTTS MP3 output is a bare frame stream with no
+# global header, so the chunk outputs concatenate by plain byte append.
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_MAX_CHUNK_CHARS = 200
+
+# Chunk subtasks from every paragraph share this one pool, so total chunk
+# concurrency is bounded no matter how many paragraph workers are chunking
+# at once — a per-paragraph inner pool would multiply up past the shared
+# session's connection pool and start paying handshakes again. It is a
+# separate pool from the paragraph workers, so a worker blocking on its
+# chunks cannot deadlock the chunks themselves.
+_chunk_pool = ThreadPoolExecutor(max_workers=16)
+
+
+def _split_sentences(paragraph: str, max_chars: int = _MAX_CHUNK_CHARS) -> List[str]:
+    """
+    Split a paragraph into sentence-aligned chunks of at most ~max_chars.
+    Short sentences are packed together; a sentence longer than the cap
+    (no punctuation) is hard-split.
+    """
+    chunks: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_SPLIT_RE.split(paragraph):
+        if not sentence:
+            continue
+        while len(sentence) > max_chars:
+            chunks.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _tts_paragraph_bytes(text: str) -> bytes:
+    """
+    Synthesize one paragraph to MP3 bytes, fanning a long paragraph out
+    over its sentence chunks in parallel and rejoining the frames in order.
+    """
+    chunks = _split_sentences(text)
+    if len(chunks) <= 1:
+        return tts_bytes_with_retry(text, retries=3, base_delay=0.4)
+    parts = _chunk_pool.map(lambda chunk: tts_bytes_with_retry(chunk, retries=3, base_delay=0.4), chunks)
+    return b"".join(parts)
+
+
+def _synthesize_to_file(idx: int, text: str, out_folder: str, rate_limit_delay: float = 0.0) -> str:
+    """
+    Synthesize one paragraph to '<out_folder>/<idx>.mp3', going through the
+    on-disk cache. Returns the file path; raises if synthesis fails.
+    """
+    # cache hit: no network, no rate limiting needed
+    cached = _cache_path(text)
+    if os.path.exists(cached):
+        with open(cached, "rb") as f:
+            data = f.read()
+    else:
+        # optional rate limit to avoid hammering the service
+        if rate_limit_delay > 0:
+            time.sleep(rate_limit_delay)
+        data = _tts_paragraph_bytes(text)
+        _cache_store(text, data)
+    path = os.path.join(out_folder, f"{idx}.mp3")
+    _write_file_bytes(path, data)
+    return path
+
+
+def _dedup_paragraphs(paragraphs: List[str]) -> Tuple[List[int], dict]:
+    """
+    Map out repeated paragraph content so each distinct text is
+    synthesized once. Returns (unique_indices, dup_map) with 1-based
+    indices; dup_map points each duplicate at the earlier index carrying
+    the same text.
+    """
+    seen = {}     # content hash -> first index with that content
+    unique_indices: List[int] = []
+    dup_map = {}  # duplicate index -> source index
+    for idx, para in enumerate(paragraphs, start=1):
+        h = hashlib.blake2b(para.encode("utf-8"), digest_size=16).digest()
+        if h in seen:
+            dup_map[idx] = seen[h]
+        else:
+            seen[h] = idx
+            unique_indices.append(idx)
+    return unique_indices, dup_map
+
+
+def _link_duplicate(src: str, dst: str) -> str:
+    """
+    Materialize dst from its synthesized source file; hardlink where the
+    filesystem allows it, otherwise copy.
+    """
+    try:
+        try:
+            os.unlink(dst)  # os.link refuses to overwrite
+        except FileNotFoundError:
+            pass
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+    return dst
+
+
 def generate_all_parallel(
     paragraphs: List[str],
     out_folder: str,
@@ -245,116 +737,305 @@ def generate_all_parallel(
         failures: list of (index, exception) for failed conversions
     """
     os.makedirs(out_folder, exist_ok=True)
-    success_paths: List[str] = []
+    folder_abs = os.path.abspath(out_folder)
+    # Slot results by index as futures complete — no post-hoc sort, no
+    # parsing indices back out of filenames.
+    results: List[Optional[str]] = [None] * len(paragraphs)
     failures: List[Tuple[int, Exception]] = []
 
-    def task(idx: int, text: str) -> str:
-        # optional rate limit to avoid hammering the service
-        if rate_limit_delay > 0:
-            time.sleep(rate_limit_delay)
-        data = tts_bytes_with_retry(text, retries=3, base_delay=0.4)
-        path = os.path.join(out_folder, f"{idx}.mp3")
-        with open(path, "wb") as f:
-            f.write(data)
-        return path
+    # Repeated paragraphs (boilerplate in templated documents) are
+    # synthesized once: only the first occurrence goes to the pool, and
+    # later duplicates are materialized from its finished file.
+    unique_indices, dup_map = _dedup_paragraphs(paragraphs)
 
-    # Submit tasks
+    # Submit tasks (unique paragraphs only)
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(task, idx, para): idx for idx, para in enumerate(paragraphs, start=1)}
+        futures = {executor.submit(_synthesize_to_file, idx, paragraphs[idx - 1], folder_abs, rate_limit_delay): idx
+                   for idx in unique_indices}
         for fut in as_completed(futures):
             idx = futures[fut]
             try:
                 path = fut.result()
-                abs_path = os.path.abspath(path)
-                success_paths.append(abs_path)
-                print(f"Saved: {abs_path}")
+                results[idx - 1] = path
+                print(f"Saved: {path}")
             except Exception as e:
                 failures.append((idx, e))
                 print(f"Error generating {idx}.mp3: {e}")
 
-    # Keep output order stable (1..N)
-    success_paths.sort(key=lambda p: int(os.path.splitext(os.path.basename(p))[0]))
+    # Materialize duplicates from their source file
+    for dup_idx, src_idx in dup_map.items():
+        src = results[src_idx - 1]
+        if src is None:
+            failures.append((dup_idx, RuntimeError(f"duplicate of paragraph {src_idx}, which failed")))
+            continue
+        dst = _link_duplicate(src, os.path.join(folder_abs, f"{dup_idx}.mp3"))
+        results[dup_idx - 1] = dst
+        print(f"Saved: {dst} (same text as {src_idx}.mp3)")
+
+    # Output order is already stable (1..N); just drop the gaps
+    success_paths = [p for p in results if p is not None]
     # Sort failures by index for stable reporting
     failures.sort(key=lambda x: x)
     return success_paths, failures
 
 
+def generate_and_play_pipelined(
+    paragraphs: List[str],
+    out_folder: str,
+    max_workers: int = 6,
+    rate_limit_delay: float = 0.0,
+    max_buffered: int = 4
+) -> Tuple[List[str], List[Tuple[int, Exception]]]:
+    """
+    Convert paragraphs to MP3 in parallel while playing them back in order.
+    Paragraph i plays as soon as it has been generated and paragraph i-1
+    has finished playing, so the user hears audio once the first paragraph
+    is ready instead of after the whole batch.
+
+    - max_buffered: how many finished paragraphs may wait ahead of playback
+      (backpressure so generation cannot run away from the listener)
+
+    Returns (success_paths, failures) like generate_all_parallel.
+    """
+    os.makedirs(out_folder, exist_ok=True)
+    folder_abs = os.path.abspath(out_folder)
+    n = len(paragraphs)
+    ordered: List[Optional[str]] = [None] * n
+    failures: List[Tuple[int, Exception]] = []
+
+    # Repeated paragraphs are synthesized once here too; submitting both
+    # copies would make two producers miss the cache together, pay the
+    # network twice, and store the same cache entry concurrently.
+    unique_indices, dup_map = _dedup_paragraphs(paragraphs)
+    dups_of = {}  # source index -> its duplicate indices
+    for dup_idx, src_idx in dup_map.items():
+        dups_of.setdefault(src_idx, []).append(dup_idx)
+
+    # pending holds generated-but-not-yet-played results, keyed by index.
+    # A failure is stored as the exception so the consumer can skip past it.
+    pending = {}
+    cond = threading.Condition()
+    next_expected = 1
+
+    def producer(idx: int, text: str):
+        try:
+            result = _synthesize_to_file(idx, text, folder_abs, rate_limit_delay)
+            ordered[idx - 1] = result
+            print(f"Saved: {result}")
+        except Exception as e:
+            result = e
+            failures.append((idx, e))
+            print(f"Error generating {idx}.mp3: {e}")
+
+        # This producer also stands in for its duplicates: materialize
+        # their files from the finished source so indices 1..n all reach
+        # the consumer.
+        publish = [(idx, result)]
+        for dup_idx in dups_of.get(idx, ()):
+            if isinstance(result, Exception):
+                dup_err = RuntimeError(f"duplicate of paragraph {idx}, which failed")
+                failures.append((dup_idx, dup_err))
+                publish.append((dup_idx, dup_err))
+            else:
+                dst = _link_duplicate(result, os.path.join(folder_abs, f"{dup_idx}.mp3"))
+                ordered[dup_idx - 1] = dst
+                print(f"Saved: {dst} (same text as {idx}.mp3)")
+                publish.append((dup_idx, dst))
+
+        with cond:
+            for pub_idx, pub_result in publish:
+                # Backpressure: wait for playback to drain the buffer,
+                # unless this is the very index the consumer is blocked on.
+                while len(pending) >= max_buffered and pub_idx != next_expected:
+                    cond.wait()
+                pending[pub_idx] = pub_result
+                cond.notify_all()
+
+    def consumer():
+        nonlocal next_expected
+        while True:
+            with cond:
+                while next_expected <= n and next_expected not in pending:
+                    cond.wait()
+                if next_expected > n:
+                    return
+                result = pending.pop(next_expected)
+                next_expected += 1
+                cond.notify_all()
+            if isinstance(result, Exception):
+                continue  # already reported by the producer
+            try:
+                _play_file(result)
+            except Exception as e:
+                print(f"Playback error for {result}: {e}")
+
+    consumer_thread = threading.Thread(target=consumer, daemon=True)
+    consumer_thread.start()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for idx in unique_indices:
+            executor.submit(producer, idx, paragraphs[idx - 1])
+    # Producers are done; wait for the tail of the playback queue.
+    consumer_thread.join()
+
+    success_paths = [p for p in ordered if p is not None]
+    failures.sort(key=lambda x: x)
+    return success_paths, failures
+
+
+def _pick_max_workers(first_paragraph: str, num_paras: int) -> int:
+    """
+    Choose a worker count for network-bound synthesis.
+
+    Honors the TTS_MAX_WORKERS environment variable when set. Otherwise
+    synthesizes the first paragraph once, timed, and sizes the pool to
+    keep roughly five seconds of work in flight at the measured latency.
+    The probe result goes straight into the cache, so that paragraph is
+    not synthesized twice.
+    """
+    env = os.environ.get("TTS_MAX_WORKERS")
+    if env:
+        try:
+            return max(1, int(env))
+        except ValueError:
+            print(f"Ignoring invalid TTS_MAX_WORKERS={env!r}")
+
+    fallback = min(32, max(4, num_paras))
+    if os.path.exists(_cache_path(first_paragraph)):
+        # A cache hit tells us nothing about service latency
+        return fallback
+    start = time.monotonic()
+    try:
+        _cache_store(first_paragraph, _tts_paragraph_bytes(first_paragraph))
+    except Exception:
+        return fallback  # the pool's own retry/reporting will handle it
+    latency = max(time.monotonic() - start, 0.05)
+    return min(32, max(4, round(5.0 / latency)), max(4, num_paras))
+
+
 # =========================
 # Main app flow
 # =========================
-def main():
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Convert text or a document to one MP3 file per paragraph."
+    )
+    parser.add_argument("--input", help="path to a .txt or .docx file (skips all interactive prompts)")
+    parser.add_argument("--output", help="output folder for the MP3 files (default: output)")
+    parser.add_argument("--workers", type=int, help="thread pool size (overrides the latency heuristic)")
+    parser.add_argument("--quiet", action="store_true", help="disable spoken prompts")
+    return parser.parse_args(argv)
+
+
+def _report_failures(failures: List[Tuple[int, Exception]]):
+    if failures:
+        print("Failures:")
+        for idx, err in failures:
+            print(f"- {idx}.mp3 -> {err}")
+
+
+def run_batch(args: argparse.Namespace):
+    """
+    Non-interactive path: read the input file, generate, exit. No spoken
+    prompts, no playback — the fast lane for scripted/CI use.
+    Exits nonzero if the input file cannot be read.
+    """
+    try:
+        text = read_text_from_file(args.input)
+    except Exception as e:
+        print(f"Could not read the file: {e}")
+        sys.exit(1)
+    paragraphs = split_into_paragraphs(text)
+    print(f"Detected {len(paragraphs)} paragraph(s).")
+    if not paragraphs:
+        print("No valid paragraphs found. Exiting.")
+        return
+    out_folder = args.output or "output"
+    max_workers = args.workers or _pick_max_workers(paragraphs[0], len(paragraphs))
+    _, failures = generate_all_parallel(paragraphs, out_folder, max_workers=max_workers)
+    _report_failures(failures)
+
+
+def main(argv: Optional[List[str]] = None):
+    global INTERACTIVE
+    args = _parse_args(argv)
+    INTERACTIVE = sys.stdin.isatty() and not args.quiet and not args.input
+
+    if args.input:
+        run_batch(args)
+        return
+
     # Intro
-    speak_and_delete("Hi there! Thanks for using the text to speech application.")
+    speak("Hi there! Thanks for using the text to speech application.")
 
     # Get user's name
-    speak_and_delete("Please enter your name.")
+    speak("Please enter your name.")
+    _prefetch_prompts("Would you like to enter text directly, or use a text file? Enter t for text or f for file.")
     name = input("Enter your name: ").strip()
 
     # Choose input method and obtain text
     full_text = get_text_via_choice()
     if not full_text:
-        speak_and_delete("No text provided. Exiting.")
-        print("No text provided. Exiting.")
+        notify("No text provided. Exiting.")
         return
 
     # Split into paragraphs
     paragraphs = split_into_paragraphs(full_text)
     num_paras = len(paragraphs)
-    speak_and_delete(f"Detected {num_paras} paragraph{'s' if num_paras != 1 else ''}.")
+    speak(f"Detected {num_paras} paragraph{'s' if num_paras != 1 else ''}.")
     print(f"Detected {num_paras} paragraph(s).")
 
     if num_paras == 0:
-        speak_and_delete("No valid paragraphs found. Exiting.")
-        print("No valid paragraphs found. Exiting.")
+        notify("No valid paragraphs found. Exiting.")
         return
 
     # Choose folder and handle overwrite behavior for all outputs
-    speak_and_delete("Enter the folder name where I should save the audio files.")
+    speak("Enter the folder name where I should save the audio files.")
     folder_path = get_folder_and_confirm_overwrite(num_paras)
 
     # Performance settings (tunable)
-    # - max_workers: increase to speed up, but be mindful of rate limits
+    # - max_workers: synthesis is network-bound, so the pool is sized from
+    #   measured per-request latency (see _pick_max_workers), not CPU
+    #   count; override with the TTS_MAX_WORKERS environment variable
     # - rate_limit_delay: small delay before each task to avoid bursts (0.0 for max speed)
-    max_workers = min(8, max(2, os.cpu_count() or 4))  # reasonable default bound
+    max_workers = args.workers or _pick_max_workers(paragraphs[0], num_paras)
     rate_limit_delay = 0.0  # set to 0.1 or 0.2 if you encounter throttling
 
-    # Parallel generation
-    generated_paths, failures = generate_all_parallel(
-        paragraphs,
-        folder_path,
-        max_workers=max_workers,
-        rate_limit_delay=rate_limit_delay
-    )
+    # Ask about playback up front so it can overlap generation: each
+    # paragraph starts playing as soon as it is ready instead of after
+    # the whole batch has been generated.
+    play_now = ask_playback()
+
+    if play_now:
+        speak("I will start playing each paragraph as soon as it is ready.")
+        generated_paths, failures = generate_and_play_pipelined(
+            paragraphs,
+            folder_path,
+            max_workers=max_workers,
+            rate_limit_delay=rate_limit_delay
+        )
+    else:
+        generated_paths, failures = generate_all_parallel(
+            paragraphs,
+            folder_path,
+            max_workers=max_workers,
+            rate_limit_delay=rate_limit_delay
+        )
 
     # Report results
     if failures and generated_paths:
-        speak_and_delete("Some files could not be generated. Please check the console for details.")
+        speak("Some files could not be generated. Please check the console for details.")
     elif failures and not generated_paths:
-        speak_and_delete("No files could be generated due to errors.")
+        speak("No files could be generated due to errors.")
     else:
-        speak_and_delete("All files have been saved successfully.")
+        speak("All files have been saved successfully.")
 
     # List failures (if any)
-    if failures:
-        print("Failures:")
-        for idx, err in failures:
-            print(f"- {idx}.mp3 -> {err}")
+    _report_failures(failures)
 
-    # Playback prompt
-    if generated_paths:
-        if ask_playback():
-            speak_and_delete("Now playing the audio files one by one.")
-            # Play in order 1..N
-            for p in generated_paths:
-                try:
-                    playsound(p)
-                except Exception as e:
-                    print(f"Playback error for {p}: {e}")
-            speak_and_delete("All available audio files have been played.")
-        else:
-            speak_and_delete("Okay, I will not play the audio files now.")
+    if play_now and generated_paths:
+        speak("All available audio files have been played.")
 
-    speak_and_delete("Goodbye!")
+    speak("Goodbye!")
 
 
 if __name__ == "__main__":